@@ -5,13 +5,18 @@ import json
 import sys
 from pathlib import Path
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; fall back to the default loop
+    uvloop = None
+
 # Add src to path
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
 
-from mongodb_client import MongoDBClient
+from mongodb_client import MongoDBClient, close_shared_clients
 from tools.fetch_news import FetchNewsTool
-from config.settings import Settings
+from config.settings import get_settings
 
 
 async def test_connection():
@@ -20,7 +25,7 @@ async def test_connection():
     print("=" * 50)
     
     # Load settings
-    settings = Settings()
+    settings = get_settings()
     print(f"\n1. Loading settings...")
     print(f"   Database: {settings.mongodb_database}")
     print(f"   Collection: {settings.mongodb_collection}")
@@ -39,7 +44,8 @@ async def test_connection():
         
         # Test article count
         print(f"\n3. Checking article count...")
-        count = await mongodb_client.count_articles()
+        summary = await mongodb_client.get_summary()
+        count = summary["count"]
         print(f"   Found {count} articles in collection")
         
         if count == 0:
@@ -50,59 +56,43 @@ async def test_connection():
         print(f"\n4. Testing fetch_news tool...")
         fetch_news_tool = FetchNewsTool(mongodb_client)
         
-        # Test 1: Fetch latest 5 articles
-        print("\n   Test 1: Fetch latest 5 articles")
-        result = await fetch_news_tool.execute({"limit": 5})
-        print(f"   ✓ Returned {len(result)} content items")
-        if result:
-            # Parse and display summary
-            text = result[0].text
-            if "Found" in text:
-                first_line = text.split('\n')[0]
-                print(f"   {first_line}")
-        
-        # Test 2: Fetch by category
-        print("\n   Test 2: Fetch technology articles")
-        result = await fetch_news_tool.execute({
-            "category": "technology",
-            "limit": 3
-        })
-        if result:
-            text = result[0].text
-            if "Found" in text:
-                first_line = text.split('\n')[0]
-                print(f"   {first_line}")
-        
-        # Test 3: Fetch with tags
-        print("\n   Test 3: Fetch articles tagged with 'ai'")
-        result = await fetch_news_tool.execute({
-            "tags": ["ai"],
-            "limit": 2
-        })
-        if result:
-            text = result[0].text
-            if "Found" in text:
-                first_line = text.split('\n')[0]
-                print(f"   {first_line}")
+        # Run the independent queries concurrently so round-trips overlap.
+        # Readable text is requested so the summary line can be printed.
+        specs = [
+            ("Test 1: Fetch latest 5 articles", {"limit": 5, "format": "text"}),
+            (
+                "Test 2: Fetch technology articles",
+                {"category": "technology", "limit": 3, "format": "text"},
+            ),
+            (
+                "Test 3: Fetch articles tagged with 'ai'",
+                {"tags": ["ai"], "limit": 2, "format": "text"},
+            ),
+            (
+                "Test 4: Fetch articles from last 24 hours",
+                {"hours_ago": 24, "limit": 5, "format": "text"},
+            ),
+        ]
+        results = await asyncio.gather(
+            *(fetch_news_tool.execute(arguments) for _, arguments in specs)
+        )
         
-        # Test 4: Recent articles
-        print("\n   Test 4: Fetch articles from last 24 hours")
-        result = await fetch_news_tool.execute({
-            "hours_ago": 24,
-            "limit": 5
-        })
-        if result:
-            text = result[0].text
-            if "Found" in text:
-                first_line = text.split('\n')[0]
-                print(f"   {first_line}")
+        for (label, _), result in zip(specs, results):
+            print(f"\n   {label}")
+            print(f"   ✓ Returned {len(result)} content items")
+            if result:
+                # Parse and display summary
+                text = result[0].text
+                if "Found" in text:
+                    first_line = text.split('\n')[0]
+                    print(f"   {first_line}")
         
         # Display available categories and tags
         print(f"\n5. Available data...")
-        categories = await mongodb_client.get_categories()
+        categories = summary["categories"]
         print(f"   Categories: {', '.join(categories)}")
         
-        tags = await mongodb_client.get_tags()
+        tags = summary["tags"]
         print(f"   Tags: {', '.join(tags[:10])}{'...' if len(tags) > 10 else ''}")
         
         print("\n" + "=" * 50)
@@ -115,8 +105,12 @@ async def test_connection():
         traceback.print_exc()
     finally:
         await mongodb_client.close()
+        await close_shared_clients()
         print("\nConnection closed.")
 
 
 if __name__ == "__main__":
-    asyncio.run(test_connection())
\ No newline at end of file
+    if uvloop is not None:
+        uvloop.run(test_connection())
+    else:
+        asyncio.run(test_connection())
\ No newline at end of file
@@ -1 +1 @@
-"""Source package.""
\ No newline at end of file
+"""Source package."""
@@ -1 +1 @@
-"""Configuration package.""
\ No newline at end of file
+"""Configuration package."""
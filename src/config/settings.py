@@ -1,5 +1,6 @@
 """Application settings using Pydantic."""
 
+from functools import lru_cache
 from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -15,6 +16,8 @@ class Settings(BaseSettings):
     # MCP Server settings
     mcp_server_port: int = 3000
     mcp_server_host: str = "0.0.0.0"
+    # Coalesce concurrent identical fetch_news calls into one query
+    fetch_news_batch_requests: bool = False
     
     # OpenAI settings (optional)
     openai_api_key: Optional[str] = None
@@ -29,4 +32,17 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False
-    )
\ No newline at end of file
+    )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the process-wide application settings.
+    
+    The environment and ``.env`` file are parsed once and the validated
+    instance is reused on subsequent calls.
+    
+    Returns:
+        Application settings
+    """
+    return Settings()
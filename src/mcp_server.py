@@ -18,9 +18,14 @@ from mcp.types import (
 )
 from pydantic import BaseModel, Field
 
-from mongodb_client import MongoDBClient
-from tools.fetch_news import FetchNewsTool
-from config.settings import Settings
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; fall back to the default loop
+    uvloop = None
+
+from mongodb_client import MongoDBClient, close_shared_clients
+from tools.fetch_news import FetchNewsArgs, FetchNewsTool
+from config.settings import Settings, get_settings
 
 # Configure logging
 logging.basicConfig(
@@ -29,6 +34,68 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Built once at import; list_tools hands out the same instance every call.
+_FETCH_NEWS_TOOL = Tool(
+    name="fetch_news",
+    description="Fetch news articles from MongoDB. You can filter by category, tags, date range, and search keywords.",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "limit": {
+                "type": "integer",
+                "description": "Maximum number of articles to fetch (default: 10, max: 50)",
+                "default": 10,
+                "minimum": 1,
+                "maximum": 50
+            },
+            "category": {
+                "type": "string",
+                "description": "Filter by news category (e.g., 'technology', 'business', 'sports')"
+            },
+            "tags": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Filter by tags (e.g., ['ai', 'machine-learning'])"
+            },
+            "search_query": {
+                "type": "string",
+                "description": "Search in title and content"
+            },
+            "hours_ago": {
+                "type": "integer",
+                "description": "Fetch articles from the last N hours",
+                "minimum": 1
+            },
+            "sort_by": {
+                "type": "string",
+                "enum": ["published_at", "title"],
+                "description": "Sort articles by field (default: published_at)",
+                "default": "published_at"
+            },
+            "sort_order": {
+                "type": "string",
+                "enum": ["asc", "desc"],
+                "description": "Sort order (default: desc)",
+                "default": "desc"
+            },
+            "include_content": {
+                "type": "boolean",
+                "description": "Include a preview of the article content (default: false)",
+                "default": False
+            },
+            "format": {
+                "type": "string",
+                "enum": ["widget", "text", "both"],
+                "description": (
+                    "Response format: widget JSON, readable text, or both (default: widget)"
+                ),
+                "default": "widget"
+            }
+        },
+        "required": []
+    }
+)
+
 
 class MCPNewsServer:
     """MCP Server for news fetching operations."""
@@ -46,7 +113,14 @@ class MCPNewsServer:
             database=settings.mongodb_database,
             collection=settings.mongodb_collection
         )
-        self.fetch_news_tool = FetchNewsTool(self.mongodb_client)
+        self.fetch_news_tool = FetchNewsTool(
+            self.mongodb_client,
+            batch_requests=settings.fetch_news_batch_requests
+        )
+        # Tool name -> (argument normalizer, handler)
+        self._handlers = {
+            "fetch_news": (FetchNewsArgs.from_arguments, self.fetch_news_tool.execute),
+        }
         
         # Register handlers
         self._register_handlers()
@@ -57,55 +131,7 @@ class MCPNewsServer:
         @self.server.list_tools()
         async def list_tools() -> List[Tool]:
             """List available tools."""
-            return [
-                Tool(
-                    name="fetch_news",
-                    description="Fetch news articles from MongoDB. You can filter by category, tags, date range, and search keywords.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "limit": {
-                                "type": "integer",
-                                "description": "Maximum number of articles to fetch (default: 10, max: 50)",
-                                "default": 10,
-                                "minimum": 1,
-                                "maximum": 50
-                            },
-                            "category": {
-                                "type": "string",
-                                "description": "Filter by news category (e.g., 'technology', 'business', 'sports')"
-                            },
-                            "tags": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Filter by tags (e.g., ['ai', 'machine-learning'])"
-                            },
-                            "search_query": {
-                                "type": "string",
-                                "description": "Search in title and content"
-                            },
-                            "hours_ago": {
-                                "type": "integer",
-                                "description": "Fetch articles from the last N hours",
-                                "minimum": 1
-                            },
-                            "sort_by": {
-                                "type": "string",
-                                "enum": ["published_at", "title"],
-                                "description": "Sort articles by field (default: published_at)",
-                                "default": "published_at"
-                            },
-                            "sort_order": {
-                                "type": "string",
-                                "enum": ["asc", "desc"],
-                                "description": "Sort order (default: desc)",
-                                "default": "desc"
-                            }
-                        },
-                        "required": []
-                    }
-                )
-            ]
+            return [_FETCH_NEWS_TOOL]
         
         @self.server.call_tool()
         async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent | ImageContent | EmbeddedResource]:
@@ -118,20 +144,23 @@ class MCPNewsServer:
             Returns:
                 List of content items
             """
-            if name == "fetch_news":
-                return await self.fetch_news_tool.execute(arguments)
-            else:
+            handler = self._handlers.get(name)
+            if handler is None:
                 raise ValueError(f"Unknown tool: {name}")
+            normalize, execute = handler
+            return await execute(normalize(arguments))
 
     async def run(self):
         """Run the MCP server."""
         logger.info("Starting News MCP Server...")
         
-        # Connect to MongoDB
-        await self.mongodb_client.connect()
-        logger.info(f"Connected to MongoDB: {self.settings.mongodb_database}")
-        
         try:
+            # Connect to MongoDB inside the try, so the shared client is
+            # closed even if startup fails
+            await self.mongodb_client.connect()
+            logger.info(f"Connected to MongoDB: {self.settings.mongodb_database}")
+            await self.mongodb_client.ensure_indexes()
+            
             # Run the server with stdio transport
             async with stdio_server() as (read_stream, write_stream):
                 await self.server.run(
@@ -142,13 +171,14 @@ class MCPNewsServer:
         finally:
             # Clean up
             await self.mongodb_client.close()
+            await close_shared_clients()
             logger.info("Server stopped")
 
 
 async def main():
     """Main entry point."""
     # Load settings
-    settings = Settings()
+    settings = get_settings()
     
     # Create and run server
     server = MCPNewsServer(settings)
@@ -156,4 +186,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file
@@ -1,15 +1,117 @@
 """MongoDB client for news article operations."""
 
+import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase, AsyncIOMotorCollection
-from pymongo import ASCENDING, DESCENDING
-from pymongo.errors import ConnectionFailure, OperationFailure
+from bson import DatetimeMS
+from pymongo import ASCENDING, DESCENDING, AsyncMongoClient, IndexModel
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.errors import ConnectionFailure, OperationFailure, PyMongoError
 
 logger = logging.getLogger(__name__)
 
+# Clients shared process-wide, one per (event loop, URI). Each client
+# owns a connection pool, so MongoDBClient instances reuse them instead of
+# paying for fresh handshakes and pool warmup.
+_client_pool: Dict[Tuple[asyncio.AbstractEventLoop, str], AsyncMongoClient] = {}
+
+_SORT_DIRECTIONS = {"asc": ASCENDING, "desc": DESCENDING}
+
+# Compound indexes serve filter + newest-first sort without an in-memory
+# SORT stage, and their prefixes cover category/tag-only queries too. The
+# tags index is partial: untagged articles never match a tags filter, so
+# they are left out of it.
+_CATEGORY_INDEX = "category_1_published_at_-1"
+_TAGS_INDEX = "tags_1_published_at_-1"
+INDEX_MODELS = [
+    IndexModel([("published_at", DESCENDING)]),
+    IndexModel([("category", ASCENDING), ("published_at", DESCENDING)], name=_CATEGORY_INDEX),
+    IndexModel(
+        [("tags", ASCENDING), ("published_at", DESCENDING)],
+        name=_TAGS_INDEX,
+        partialFilterExpression={"tags": {"$exists": True}},
+    ),
+    # Text search on title and content
+    IndexModel([("title", "text"), ("content", "text")]),
+]
+
+# fetch_news filter clauses, one per optional argument. Bit N of a query's
+# signature is set when clause N applies.
+_FILTER_CLAUSES = (
+    '"category": category',
+    '"tags": {"$in": tags}',
+    # Millisecond epoch encodes straight to a BSON UTC datetime
+    '"published_at": {"$gte": DatetimeMS(time.time_ns() // 1_000_000 - hours_ago * 3_600_000)}',
+    # Text search (requires text index on title and content fields)
+    '"$text": {"$search": search_query}',
+)
+
+
+def _compile_filter_builder(signature: int) -> Callable[..., Dict[str, Any]]:
+    """Compile a builder emitting the filter for one argument signature.
+    
+    The generated function returns a single dict literal containing only
+    the clauses selected by ``signature``, so building a filter costs no
+    per-call branching. Only the constant clauses above are interpolated.
+    """
+    clauses = ", ".join(
+        clause for bit, clause in enumerate(_FILTER_CLAUSES) if signature & (1 << bit)
+    )
+    return eval(
+        f"lambda category, tags, hours_ago, search_query: {{{clauses}}}",
+        {"DatetimeMS": DatetimeMS, "time": time},
+    )
+
+
+_FILTER_BUILDERS = tuple(
+    _compile_filter_builder(signature) for signature in range(1 << len(_FILTER_CLAUSES))
+)
+
+# $addFields stage converting non-JSON BSON types into strings. Only real
+# dates are converted; string dates (e.g. from JSON-imported feeds) pass
+# through, and a missing published_at stays missing.
+_JSON_SAFE_FIELDS = {
+    "_id": {"$toString": "$_id"},
+    "published_at": {
+        "$cond": [
+            {"$eq": [{"$type": "$published_at"}, "date"]},
+            {"$dateToString": {"format": "%Y-%m-%dT%H:%M:%S.%LZ", "date": "$published_at"}},
+            "$published_at",
+        ]
+    },
+}
+
+# Articles grouped into the category list; uncategorized ones would
+# otherwise form a null group.
+_HAS_CATEGORY = {"category": {"$exists": True, "$ne": None}}
+
+# Seconds to keep category/tag lists cached; they change rarely.
+_DISTINCT_CACHE_TTL = 60.0
+
+
+def _get_shared_client(uri: str) -> AsyncMongoClient:
+    """Return the shared client for the running event loop and URI."""
+    key = (asyncio.get_running_loop(), uri)
+    client = _client_pool.get(key)
+    if client is None:
+        client = AsyncMongoClient(uri, maxPoolSize=100, minPoolSize=10)
+        _client_pool[key] = client
+    return client
+
+
+async def close_shared_clients():
+    """Close the shared clients created on the running event loop.
+    
+    Entry points await this before their event loop shuts down; clients
+    can't be closed once the loop is gone.
+    """
+    loop = asyncio.get_running_loop()
+    for key in [key for key in _client_pool if key[0] is loop]:
+        await _client_pool.pop(key).close()
+
 
 class MongoDBClient:
     """MongoDB client for news operations."""
@@ -25,14 +127,18 @@ class MongoDBClient:
         self.uri = uri
         self.database_name = database
         self.collection_name = collection
-        self.client: Optional[AsyncIOMotorClient] = None
-        self.database: Optional[AsyncIOMotorDatabase] = None
-        self.collection: Optional[AsyncIOMotorCollection] = None
+        self.client: Optional[AsyncMongoClient] = None
+        self.database: Optional[AsyncDatabase] = None
+        self.collection: Optional[AsyncCollection] = None
+        self._categories_cache: Optional[Tuple[float, List[str]]] = None
+        self._tags_cache: Optional[Tuple[float, List[str]]] = None
+        # Set once ensure_indexes succeeds; index hints are only safe then
+        self._indexes_ready = False
 
     async def connect(self):
         """Connect to MongoDB."""
         try:
-            self.client = AsyncIOMotorClient(self.uri)
+            self.client = _get_shared_client(self.uri)
             # Verify connection
             await self.client.admin.command('ping')
             
@@ -45,10 +151,34 @@ class MongoDBClient:
             raise
 
     async def close(self):
-        """Close MongoDB connection."""
+        """Release this instance's handle on the shared MongoDB client.
+        
+        The underlying client stays open for other instances on the same
+        event loop until close_shared_clients() is awaited.
+        """
         if self.client:
-            self.client.close()
-            logger.info("MongoDB connection closed")
+            self.client = None
+            self.database = None
+            self.collection = None
+            logger.info("MongoDB connection released")
+
+    async def ensure_indexes(self):
+        """Create the indexes fetch_news and the listing queries rely on.
+        
+        Existing indexes are left as they are. Any driver error (e.g. a
+        read-only user, a non-partial tags index from an older seed, or a
+        network timeout) is logged rather than treated as fatal: queries
+        still work without the indexes, they just aren't given index hints.
+        """
+        if self.collection is None:
+            raise RuntimeError("MongoDB client not connected")
+
+        try:
+            await self.collection.create_indexes(INDEX_MODELS)
+        except PyMongoError as e:
+            logger.warning(f"Could not create MongoDB indexes: {e}")
+        else:
+            self._indexes_ready = True
 
     async def fetch_news(
         self,
@@ -58,9 +188,13 @@ class MongoDBClient:
         search_query: Optional[str] = None,
         hours_ago: Optional[int] = None,
         sort_by: str = "published_at",
-        sort_order: str = "desc"
-    ) -> List[Dict[str, Any]]:
-        """Fetch news articles from MongoDB.
+        sort_order: str = "desc",
+        projection: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream news articles from MongoDB.
+        
+        Articles are yielded as they arrive from the cursor, so callers can
+        format them while the rest of the batch is still being decoded.
         
         Args:
             limit: Maximum number of articles to fetch
@@ -70,52 +204,55 @@ class MongoDBClient:
             hours_ago: Fetch articles from the last N hours
             sort_by: Field to sort by
             sort_order: Sort order ('asc' or 'desc')
+            projection: $project stage spec; supports expressions such as
+                server-side truncation (all fields when None)
             
-        Returns:
-            List of news articles
+        Yields:
+            News articles
         """
-        if not self.collection:
+        if self.collection is None:
             raise RuntimeError("MongoDB client not connected")
 
-        # Build query filter
-        query_filter: Dict[str, Any] = {}
-
-        if category:
-            query_filter["category"] = category
-
-        if tags:
-            query_filter["tags"] = {"$in": tags}
+        # Build query filter from the builder specialized for the set arguments
+        signature = (
+            bool(category)
+            | bool(tags) << 1
+            | bool(hours_ago) << 2
+            | bool(search_query) << 3
+        )
+        query_filter = _FILTER_BUILDERS[signature](category, tags, hours_ago, search_query)
 
-        if hours_ago:
-            cutoff_time = datetime.utcnow() - timedelta(hours=hours_ago)
-            query_filter["published_at"] = {"$gte": cutoff_time}
+        # Determine sort direction
+        sort_direction = _SORT_DIRECTIONS.get(sort_order, ASCENDING)
 
-        if search_query:
-            # Text search (requires text index on title and content fields)
-            query_filter["$text"] = {"$search": search_query}
+        pipeline: List[Dict[str, Any]] = [
+            {"$match": query_filter},
+            {"$sort": {sort_by: sort_direction}},
+            {"$limit": limit},
+        ]
+        if projection:
+            pipeline.append({"$project": projection})
+        # Stringify ObjectId and datetime server-side for JSON serialization
+        pipeline.append({"$addFields": _JSON_SAFE_FIELDS})
 
-        # Determine sort direction
-        sort_direction = DESCENDING if sort_order == "desc" else ASCENDING
+        # batchSize == limit returns the whole result in the first reply,
+        # with no getMore round-trip
+        options: Dict[str, Any] = {"batchSize": limit}
+        if self._indexes_ready and category and not search_query:
+            # Pin the category index so the plan isn't re-evaluated per call;
+            # $text queries must use the text index instead. A hint naming
+            # an index that doesn't exist fails the query, hence the check.
+            options["hint"] = _CATEGORY_INDEX
 
         try:
             # Execute query
-            cursor = self.collection.find(query_filter).sort(
-                sort_by, sort_direction
-            ).limit(limit)
-
-            # Convert cursor to list
-            articles = await cursor.to_list(length=limit)
+            cursor = await self.collection.aggregate(pipeline, **options)
+            count = 0
+            async for article in cursor:
+                count += 1
+                yield article
 
-            # Convert ObjectId to string for JSON serialization
-            for article in articles:
-                if "_id" in article:
-                    article["_id"] = str(article["_id"])
-                # Convert datetime to ISO format string
-                if "published_at" in article and isinstance(article["published_at"], datetime):
-                    article["published_at"] = article["published_at"].isoformat()
-
-            logger.info(f"Fetched {len(articles)} articles")
-            return articles
+            logger.info("Fetched %d articles", count)
 
         except OperationFailure as e:
             logger.error(f"MongoDB operation failed: {e}")
@@ -124,27 +261,84 @@ class MongoDBClient:
     async def get_categories(self) -> List[str]:
         """Get all distinct categories.
         
+        Results are grouped server-side and cached in-process for a short
+        TTL. Articles without a category are skipped.
+        
         Returns:
             List of category names
         """
-        if not self.collection:
+        if self.collection is None:
             raise RuntimeError("MongoDB client not connected")
 
-        categories = await self.collection.distinct("category")
+        if self._categories_cache is not None:
+            cached_at, categories = self._categories_cache
+            if time.monotonic() - cached_at < _DISTINCT_CACHE_TTL:
+                return categories
+
+        # No index hint: it would fail on databases where the index is missing
+        cursor = await self.collection.aggregate([
+            {"$match": _HAS_CATEGORY},
+            {"$group": {"_id": "$category"}},
+        ])
+        categories = [doc["_id"] for doc in await cursor.to_list(None)]
+        self._categories_cache = (time.monotonic(), categories)
         return categories
 
     async def get_tags(self) -> List[str]:
         """Get all distinct tags.
         
+        Results are grouped server-side and cached in-process for a short
+        TTL.
+        
         Returns:
             List of tag names
         """
-        if not self.collection:
+        if self.collection is None:
             raise RuntimeError("MongoDB client not connected")
 
-        tags = await self.collection.distinct("tags")
+        if self._tags_cache is not None:
+            cached_at, tags = self._tags_cache
+            if time.monotonic() - cached_at < _DISTINCT_CACHE_TTL:
+                return tags
+
+        # The $match lets the partial tags index answer the query
+        cursor = await self.collection.aggregate([
+            {"$match": {"tags": {"$exists": True}}},
+            {"$unwind": "$tags"},
+            {"$group": {"_id": "$tags"}},
+        ])
+        tags = [doc["_id"] for doc in await cursor.to_list(None)]
+        self._tags_cache = (time.monotonic(), tags)
         return tags
 
+    async def get_summary(self) -> Dict[str, Any]:
+        """Get article count, categories and tags in a single round-trip.
+        
+        Returns:
+            Dict with ``count``, ``categories`` and ``tags`` keys
+        """
+        if self.collection is None:
+            raise RuntimeError("MongoDB client not connected")
+
+        cursor = await self.collection.aggregate([
+            {
+                "$facet": {
+                    "count": [{"$count": "n"}],
+                    "categories": [
+                        {"$match": _HAS_CATEGORY},
+                        {"$group": {"_id": "$category"}},
+                    ],
+                    "tags": [{"$unwind": "$tags"}, {"$group": {"_id": "$tags"}}],
+                }
+            }
+        ])
+        facets = (await cursor.to_list(None))[0]
+        return {
+            "count": facets["count"][0]["n"] if facets["count"] else 0,
+            "categories": [doc["_id"] for doc in facets["categories"]],
+            "tags": [doc["_id"] for doc in facets["tags"]],
+        }
+
     async def count_articles(self, query_filter: Optional[Dict[str, Any]] = None) -> int:
         """Count articles matching the filter.
         
@@ -154,8 +348,12 @@ class MongoDBClient:
         Returns:
             Number of matching articles
         """
-        if not self.collection:
+        if self.collection is None:
             raise RuntimeError("MongoDB client not connected")
 
-        count = await self.collection.count_documents(query_filter or {})
+        if not query_filter:
+            # Unfiltered counts come from collection metadata instead of a scan
+            return await self.collection.estimated_document_count()
+
+        count = await self.collection.count_documents(query_filter)
         return count
\ No newline at end of file
@@ -1 +1 @@
-"""Tools package for MCP server.""
\ No newline at end of file
+"""Tools package for MCP server."""
@@ -0,0 +1,105 @@
+"""Article rendering for the fetch news tool.
+
+This module is self-contained (plain dicts, strings and lists only) so it
+can be compiled to a C extension with mypyc for high-QPS deployments; see
+``make compile``. The pure-Python version is used when it isn't compiled.
+"""
+
+from typing import Any, Dict, Final, List, Optional, Tuple
+
+# Characters of ``content`` shown in the widget
+CONTENT_PREVIEW_CHARS: Final = 500
+
+# Readable-output line prefixes, shared across calls instead of being
+# rebuilt inside per-field f-strings
+_P_SOURCE: Final = "   📰 Source: "
+_P_AUTHOR: Final = "   ✍️  Author: "
+_P_PUBLISHED: Final = "   📅 Published: "
+_P_CATEGORY: Final = "   🏷️  Category: "
+_P_TAGS: Final = "   🔖 Tags: "
+_P_DESCRIPTION: Final = "   📝 "
+_P_URL: Final = "   🔗 [Read more]("
+
+# Widget article fields as (output key, article key, default), in output
+# order. ``content`` is truncated afterwards; ``tags`` is added last with a
+# fresh list default.
+_FIELDS: Final[Tuple[Tuple[str, str, Any], ...]] = (
+    ("id", "_id", None),
+    ("title", "title", "Untitled"),
+    ("description", "description", ""),
+    ("content", "content", None),
+    ("author", "author", "Unknown"),
+    ("source", "source", "Unknown Source"),
+    ("url", "url", ""),
+    ("image_url", "image_url", ""),
+    ("published_at", "published_at", ""),
+    ("category", "category", "general"),
+)
+
+
+def render_article(
+    index: int,
+    article: Dict[str, Any],
+    parts: Optional[List[str]]
+) -> Dict[str, Any]:
+    """Render one article's readable text and widget dict.
+
+    Args:
+        index: 1-based position of the article in the results
+        article: News article
+        parts: Readable text fragments; this article's lines are appended.
+            None skips readable rendering entirely.
+
+    Returns:
+        Widget article dict
+    """
+    get = article.get
+    widget = {out: get(key, default) for out, key, default in _FIELDS}
+    content = widget["content"]
+    # Already cut to the preview length server-side when projected; the
+    # slice then returns the same string without copying
+    widget["content"] = f"{content[:CONTENT_PREVIEW_CHARS]}..." if content else ""
+    widget["tags"] = tags = get("tags", [])
+
+    if parts is not None:
+        # Fields whose widget default is falsy are reused from the widget
+        # dict, since the readable output only tests truthiness; the rest
+        # have readable-specific defaults.
+        published_at = widget["published_at"]
+        description = widget["description"]
+        url = widget["url"]
+        author = get("author")
+        category = get("category")
+        parts.extend((
+            "**", str(index), ". ", str(widget["title"]), "**\n",
+            _P_SOURCE, str(get("source", "Unknown")), "\n",
+        ))
+        if author:
+            parts.extend((_P_AUTHOR, str(author), "\n"))
+        if published_at:
+            parts.extend((_P_PUBLISHED, str(published_at), "\n"))
+        if category:
+            parts.extend((_P_CATEGORY, str(category), "\n"))
+        if tags:
+            parts.extend((_P_TAGS, ", ".join(tags[:5]), "\n"))
+        if description:
+            parts.extend((_P_DESCRIPTION, description[:200], "...\n"))
+        if url:
+            parts.extend((_P_URL, str(url), ")\n"))
+        parts.append("\n")
+
+    return widget
+
+
+def join_readable(parts: List[str], count: int) -> str:
+    """Join rendered article parts under the result header.
+
+    Args:
+        parts: Readable text fragments for all articles
+        count: Number of rendered articles
+
+    Returns:
+        Formatted text output
+    """
+    parts.insert(0, f"Found {count} news article(s):\n\n")
+    return "".join(parts)
@@ -1,69 +1,239 @@
 """Fetch news tool implementation."""
 
-import json
+import asyncio
+import itertools
 import logging
-from typing import Any, Dict, List
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, NamedTuple, Optional, Tuple
 
-from mcp.types import TextContent, ImageContent, EmbeddedResource
+from mcp.types import EmbeddedResource, ImageContent, TextContent, TextResourceContents
 
 from mongodb_client import MongoDBClient
+from tools._render import CONTENT_PREVIEW_CHARS, join_readable, render_article
 
 logger = logging.getLogger(__name__)
 
 
+def _json_default(value: Any) -> str:
+    """Serialize values the JSON encoders don't handle natively.
+    
+    Datetimes use ISO 8601 (as orjson emits them); anything else, e.g. a raw
+    ObjectId, falls back to its string form.
+    """
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+# Prefer orjson, then ujson (for deployments where orjson can't be built),
+# then the standard library. All three produce the same compact output.
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=_json_default).decode()
+except ImportError:  # pragma: no cover - depends on the deployment
+    try:
+        import ujson
+
+        def _dumps(obj: Any) -> str:
+            return ujson.dumps(
+                obj, ensure_ascii=False, escape_forward_slashes=False, default=_json_default
+            )
+    except ImportError:
+        import json
+
+        def _dumps(obj: Any) -> str:
+            return json.dumps(
+                obj, ensure_ascii=False, separators=(",", ":"), default=_json_default
+            )
+
+# Fields the widget renders. The multi-KB ``content`` body is only fetched
+# when explicitly requested.
+SUMMARY_PROJECTION = {
+    "_id": 1,
+    "title": 1,
+    "description": 1,
+    "author": 1,
+    "source": 1,
+    "url": 1,
+    "image_url": 1,
+    "published_at": 1,
+    "category": 1,
+    "tags": 1,
+}
+
+# Same fields plus ``content``, truncated server-side to the preview length
+# so the full body never crosses the wire.
+CONTENT_PROJECTION = {
+    **SUMMARY_PROJECTION,
+    "content": {"$substrCP": ["$content", 0, CONTENT_PREVIEW_CHARS]},
+}
+
+# Rendered response cache; the composed output for a popular query is
+# reused until the TTL expires. It is the only cache on the fetch path,
+# so this TTL bounds how stale a response can be.
+_RESPONSE_CACHE_TTL = 60.0
+_RESPONSE_CACHE_MAXSIZE = 256
+
+# Widget data travels as an embedded JSON resource next to the readable text
+WIDGET_RESOURCE_URI = "widget://news"
+
+# Content items of a rendered response
+_Content = TextContent | EmbeddedResource
+
+# Seconds a coalesced call waits for identical calls to join it
+_BATCH_WINDOW = 0.005
+
+
+class FetchNewsArgs(NamedTuple):
+    """Normalized fetch_news tool arguments."""
+
+    limit: int = 10
+    category: Optional[str] = None
+    tags: Optional[Tuple[str, ...]] = None
+    search_query: Optional[str] = None
+    hours_ago: Optional[int] = None
+    sort_by: str = "published_at"
+    sort_order: str = "desc"
+    include_content: bool = False
+    format: str = "widget"
+
+    @classmethod
+    def from_arguments(cls, arguments: Dict[str, Any]) -> "FetchNewsArgs":
+        """Build normalized arguments from a raw MCP arguments dict.
+        
+        Args:
+            arguments: Tool arguments as received from the client
+            
+        Returns:
+            Normalized arguments with defaults applied
+        """
+        tags = arguments.get("tags")
+        search_query = arguments.get("search_query")
+        if search_query:
+            # $text matching is case-insensitive and whitespace-tokenized, so
+            # normalizing lets equivalent searches share one cache entry
+            search_query = " ".join(search_query.split()).lower()
+
+        return cls(
+            limit=arguments.get("limit", 10),
+            category=arguments.get("category"),
+            # Tag order doesn't change the $in match; sorting it lets
+            # reordered tag lists share one cache entry
+            tags=tuple(sorted(tags)) if tags else None,
+            search_query=search_query,
+            hours_ago=arguments.get("hours_ago"),
+            sort_by=arguments.get("sort_by", "published_at"),
+            sort_order=arguments.get("sort_order", "desc"),
+            include_content=arguments.get("include_content", False),
+            format=arguments.get("format", "widget"),
+        )
+
+
+class _BatchScheduler:
+    """Coalesce concurrent calls with the same key into a single run.
+    
+    The first call for a key waits a short window, then runs; calls with
+    the same key that arrive before that run finishes share its result
+    instead of starting their own.
+    """
+
+    def __init__(self, run: Callable[[Any], Awaitable[Any]], window: float = _BATCH_WINDOW):
+        """Initialize the scheduler.
+        
+        Args:
+            run: Coroutine function executed once per batch
+            window: Seconds to wait for other callers before running
+        """
+        self._run = run
+        self._window = window
+        self._pending: Dict[Hashable, "asyncio.Task[Any]"] = {}
+
+    async def submit(self, key: Hashable, arguments: Any) -> Any:
+        """Run ``arguments``, or join the pending run for ``key``.
+        
+        Args:
+            key: Hashable identity of the call
+            arguments: Arguments passed to ``run`` when a new batch starts
+            
+        Returns:
+            Result of the batch's run
+        """
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._flush(key, arguments))
+            self._pending[key] = task
+        # Shielded so one cancelled caller doesn't cancel the shared run
+        return await asyncio.shield(task)
+
+    async def _flush(self, key: Hashable, arguments: Any) -> Any:
+        try:
+            await asyncio.sleep(self._window)
+            return await self._run(arguments)
+        finally:
+            del self._pending[key]
+
+
 class FetchNewsTool:
     """Tool for fetching news articles from MongoDB."""
 
-    def __init__(self, mongodb_client: MongoDBClient):
+    def __init__(self, mongodb_client: MongoDBClient, batch_requests: bool = False):
         """Initialize the fetch news tool.
         
         Args:
             mongodb_client: MongoDB client instance
+            batch_requests: Coalesce concurrent calls with identical
+                arguments into one database query
         """
         self.mongodb_client = mongodb_client
+        self._cache: "OrderedDict[FetchNewsArgs, Tuple[float, List[_Content]]]" = OrderedDict()
+        self._batcher = _BatchScheduler(self._fetch_and_render) if batch_requests else None
 
-    async def execute(self, arguments: Dict[str, Any]) -> List[TextContent | ImageContent | EmbeddedResource]:
+    async def execute(
+        self,
+        arguments: FetchNewsArgs | Dict[str, Any]
+    ) -> List[TextContent | ImageContent | EmbeddedResource]:
         """Execute the fetch news tool.
         
+        Rendered responses are cached per argument set for a short TTL, so
+        repeated queries skip both the database and the formatting work.
+        With request batching enabled, identical calls that are in flight at
+        the same time also share a single query.
+        
         Args:
-            arguments: Tool arguments containing filters and options
+            arguments: Normalized arguments, or a raw arguments dict
             
         Returns:
             List of content items formatted for ChatGPT widget display
         """
         try:
-            # Extract arguments with defaults
-            limit = arguments.get("limit", 10)
-            category = arguments.get("category")
-            tags = arguments.get("tags")
-            search_query = arguments.get("search_query")
-            hours_ago = arguments.get("hours_ago")
-            sort_by = arguments.get("sort_by", "published_at")
-            sort_order = arguments.get("sort_order", "desc")
-
-            logger.info(f"Fetching news with arguments: {arguments}")
-
-            # Fetch articles from MongoDB
-            articles = await self.mongodb_client.fetch_news(
-                limit=limit,
-                category=category,
-                tags=tags,
-                search_query=search_query,
-                hours_ago=hours_ago,
-                sort_by=sort_by,
-                sort_order=sort_order
-            )
+            if not isinstance(arguments, FetchNewsArgs):
+                arguments = FetchNewsArgs.from_arguments(arguments)
 
-            if not articles:
-                return [
-                    TextContent(
-                        type="text",
-                        text="No news articles found matching your criteria."
-                    )
-                ]
+            # Normalized arguments are hashable and serve as the cache key
+            cache_key = arguments
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                cached_at, content = cached
+                if time.monotonic() - cached_at < _RESPONSE_CACHE_TTL:
+                    self._cache.move_to_end(cache_key)
+                    return content
+                del self._cache[cache_key]
+
+            logger.info("Fetching news with arguments: %s", arguments)
 
-            # Format articles for widget display
-            return self._format_articles_for_widget(articles)
+            if self._batcher is not None:
+                content = await self._batcher.submit(cache_key, arguments)
+            else:
+                content = await self._fetch_and_render(arguments)
+
+            self._cache[cache_key] = (time.monotonic(), content)
+            if len(self._cache) > _RESPONSE_CACHE_MAXSIZE:
+                self._cache.popitem(last=False)
+            return content
 
         except Exception as e:
             logger.error(f"Error fetching news: {e}", exc_info=True)
@@ -74,88 +244,89 @@ class FetchNewsTool:
                 )
             ]
 
-    def _format_articles_for_widget(self, articles: List[Dict[str, Any]]) -> List[TextContent]:
-        """Format articles for ChatGPT widget display.
-        
-        This formats the articles in a structured way that ChatGPT can render
-        as interactive widgets, similar to the pizza example.
+    async def _fetch_and_render(
+        self,
+        arguments: FetchNewsArgs
+    ) -> List[TextContent | EmbeddedResource]:
+        """Fetch matching articles and render the tool response.
         
         Args:
-            articles: List of news articles from MongoDB
+            arguments: Normalized arguments
             
         Returns:
-            List of TextContent with structured widget data
+            List of content items formatted for ChatGPT widget display
         """
-        # Create a structured response that ChatGPT can render as widgets
-        widget_data = {
-            "type": "news_feed",
-            "count": len(articles),
-            "articles": []
-        }
-
-        for article in articles:
-            widget_article = {
-                "id": article.get("_id"),
-                "title": article.get("title", "Untitled"),
-                "description": article.get("description", ""),
-                "content": article.get("content", "")[:500] + "..." if article.get("content") else "",
-                "author": article.get("author", "Unknown"),
-                "source": article.get("source", "Unknown Source"),
-                "url": article.get("url", ""),
-                "image_url": article.get("image_url", ""),
-                "published_at": article.get("published_at", ""),
-                "category": article.get("category", "general"),
-                "tags": article.get("tags", [])
-            }
-            widget_data["articles"].append(widget_article)
-
-        # Return formatted content
-        # The text includes both human-readable format and JSON for widget rendering
-        text_content = self._create_readable_output(articles)
-        json_content = json.dumps(widget_data, indent=2)
-
-        return [
-            TextContent(
-                type="text",
-                text=f"{text_content}\n\n<!-- Widget Data -->\n```json\n{json_content}\n```"
+        # Stream articles from MongoDB, rendering each one as it arrives.
+        # Readable text is only rendered when the format asks for it.
+        parts = None if arguments.format == "widget" else []
+        position = itertools.count(1)
+        stream = self.mongodb_client.fetch_news(
+            limit=arguments.limit,
+            category=arguments.category,
+            tags=arguments.tags,
+            search_query=arguments.search_query,
+            hours_ago=arguments.hours_ago,
+            sort_by=arguments.sort_by,
+            sort_order=arguments.sort_order,
+            projection=(
+                CONTENT_PROJECTION if arguments.include_content else SUMMARY_PROJECTION
             )
+        )
+        widget_articles = [
+            render_article(next(position), article, parts) async for article in stream
         ]
 
-    def _create_readable_output(self, articles: List[Dict[str, Any]]) -> str:
-        """Create human-readable text output.
+        if not widget_articles:
+            return [
+                TextContent(
+                    type="text",
+                    text="No news articles found matching your criteria."
+                )
+            ]
+
+        # Format articles for widget display
+        return self._compose_widget_content(
+            join_readable(parts, len(widget_articles)) if parts is not None else None,
+            widget_articles if arguments.format != "text" else None
+        )
+
+    def _compose_widget_content(
+        self,
+        text_content: Optional[str],
+        widget_articles: Optional[List[Dict[str, Any]]]
+    ) -> List[TextContent | EmbeddedResource]:
+        """Combine readable text and widget articles into the tool response.
+        
+        The widget data is sent as compact JSON in an embedded resource, so
+        clients read it directly instead of parsing it out of the text.
         
         Args:
-            articles: List of news articles
+            text_content: Human-readable text output, or None to omit it
+            widget_articles: Widget article dicts, or None to omit the widget
             
         Returns:
-            Formatted text output
+            Readable TextContent and/or the widget data EmbeddedResource
         """
-        output = f"Found {len(articles)} news article(s):\n\n"
+        content: List[TextContent | EmbeddedResource] = []
+        if text_content is not None:
+            content.append(TextContent(type="text", text=text_content))
 
-        for i, article in enumerate(articles, 1):
-            output += f"**{i}. {article.get('title', 'Untitled')}**\n"
-            output += f"   📰 Source: {article.get('source', 'Unknown')}\n"
-            
-            if article.get('author'):
-                output += f"   ✍️  Author: {article.get('author')}\n"
-            
-            if article.get('published_at'):
-                output += f"   📅 Published: {article.get('published_at')}\n"
-            
-            if article.get('category'):
-                output += f"   🏷️  Category: {article.get('category')}\n"
-            
-            if article.get('tags'):
-                tags = ", ".join(article.get('tags', [])[:5])
-                output += f"   🔖 Tags: {tags}\n"
-            
-            if article.get('description'):
-                desc = article.get('description', '')[:200]
-                output += f"   📝 {desc}...\n"
-            
-            if article.get('url'):
-                output += f"   🔗 [Read more]({article.get('url')})\n"
-            
-            output += "\n"
+        if widget_articles is not None:
+            # Create a structured response that ChatGPT can render as widgets
+            widget_data = {
+                "type": "news_feed",
+                "count": len(widget_articles),
+                "articles": widget_articles
+            }
+            content.append(
+                EmbeddedResource(
+                    type="resource",
+                    resource=TextResourceContents(
+                        uri=WIDGET_RESOURCE_URI,
+                        mimeType="application/json",
+                        text=_dumps(widget_data)
+                    )
+                )
+            )
 
-        return output
\ No newline at end of file
+        return content
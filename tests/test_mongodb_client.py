@@ -0,0 +1,213 @@
+"""Tests for the MongoDB client."""
+
+import pytest
+from bson import DatetimeMS
+from pymongo.errors import NetworkTimeout, OperationFailure
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import mongodb_client
+from mongodb_client import MongoDBClient, _get_shared_client, close_shared_clients
+
+
+@pytest.fixture(autouse=True)
+def clear_client_pool():
+    """Ensure each test starts with an empty shared client pool."""
+    mongodb_client._client_pool.clear()
+    yield
+    mongodb_client._client_pool.clear()
+
+
+@pytest.mark.asyncio
+async def test_shared_client_reused_per_loop_and_uri():
+    """Test that clients are shared for the same loop and URI."""
+    with patch.object(
+        mongodb_client, "AsyncMongoClient", side_effect=lambda *a, **k: MagicMock()
+    ) as factory:
+        first = _get_shared_client("mongodb://localhost:27017")
+        second = _get_shared_client("mongodb://localhost:27017")
+        other = _get_shared_client("mongodb://other:27017")
+
+    assert first is second
+    assert other is not first
+    assert factory.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_close_shared_clients_closes_this_loops_clients():
+    """Test that closing shared clients closes them and empties the pool."""
+    client = MagicMock(close=AsyncMock())
+    with patch.object(mongodb_client, "AsyncMongoClient", return_value=client):
+        _get_shared_client("mongodb://localhost:27017")
+
+    await close_shared_clients()
+
+    client.close.assert_awaited_once()
+    assert mongodb_client._client_pool == {}
+
+
+def mock_cursor(docs):
+    """Create a mock async cursor over the given documents."""
+    cursor = MagicMock()
+    cursor.__aiter__.return_value = docs
+    cursor.to_list = AsyncMock(return_value=docs)
+    return cursor
+
+
+async def collect(articles):
+    """Drain an async iterator of articles into a list."""
+    return [article async for article in articles]
+
+
+@pytest.fixture
+def connected_client():
+    """Create a MongoDBClient with a mock collection attached."""
+    client = MongoDBClient(
+        uri="mongodb://localhost:27017",
+        database="test_db",
+        collection="test_articles"
+    )
+    client.collection = MagicMock()
+    return client
+
+
+@pytest.mark.asyncio
+async def test_get_tags_groups_and_caches(connected_client):
+    """Test that tags are grouped server-side and cached between calls."""
+    cursor = mock_cursor([{"_id": "ai"}, {"_id": "climate"}])
+    connected_client.collection.aggregate = AsyncMock(return_value=cursor)
+
+    assert await connected_client.get_tags() == ["ai", "climate"]
+    assert await connected_client.get_tags() == ["ai", "climate"]
+
+    connected_client.collection.aggregate.assert_called_once_with([
+        {"$match": {"tags": {"$exists": True}}},
+        {"$unwind": "$tags"},
+        {"$group": {"_id": "$tags"}},
+    ])
+
+
+@pytest.mark.asyncio
+async def test_get_categories_skips_uncategorized(connected_client):
+    """Test that articles without a category don't produce a null group."""
+    cursor = mock_cursor([{"_id": "technology"}])
+    connected_client.collection.aggregate = AsyncMock(return_value=cursor)
+
+    assert await connected_client.get_categories() == ["technology"]
+
+    pipeline = connected_client.collection.aggregate.call_args.args[0]
+    assert pipeline[0] == {"$match": {"category": {"$exists": True, "$ne": None}}}
+    assert "hint" not in connected_client.collection.aggregate.call_args.kwargs
+
+
+@pytest.mark.asyncio
+async def test_ensure_indexes_tolerates_conflicts(connected_client):
+    """Test that an index conflict is logged and disables index hints."""
+    connected_client.collection.create_indexes = AsyncMock(
+        side_effect=OperationFailure("Index with name: tags_1_published_at_-1 already exists")
+    )
+    connected_client.collection.aggregate = AsyncMock(return_value=mock_cursor([]))
+
+    await connected_client.ensure_indexes()
+    await collect(connected_client.fetch_news(category="technology"))
+
+    connected_client.collection.create_indexes.assert_called_once_with(mongodb_client.INDEX_MODELS)
+    assert "hint" not in connected_client.collection.aggregate.call_args.kwargs
+
+
+@pytest.mark.asyncio
+async def test_ensure_indexes_tolerates_network_errors(connected_client):
+    """Test that a network error while creating indexes isn't fatal."""
+    connected_client.collection.create_indexes = AsyncMock(side_effect=NetworkTimeout("timed out"))
+
+    await connected_client.ensure_indexes()
+
+    assert connected_client._indexes_ready is False
+
+
+@pytest.mark.asyncio
+async def test_fetch_news_hints_category_index_once_ensured(connected_client):
+    """Test that category queries hint the compound index once it exists."""
+    connected_client.collection.create_indexes = AsyncMock()
+    connected_client.collection.aggregate = AsyncMock(return_value=mock_cursor([]))
+
+    await connected_client.ensure_indexes()
+    await collect(connected_client.fetch_news(limit=5, category="technology"))
+
+    assert connected_client.collection.aggregate.call_args.kwargs == {
+        "batchSize": 5, "hint": "category_1_published_at_-1"
+    }
+
+
+@pytest.mark.asyncio
+async def test_fetch_news_builds_pipeline(connected_client):
+    """Test that fetch_news filters, sorts and stringifies server-side."""
+    cursor = mock_cursor([{"_id": "article1", "title": "AI"}])
+    connected_client.collection.aggregate = AsyncMock(return_value=cursor)
+
+    articles = await collect(connected_client.fetch_news(
+        limit=5, category="technology", sort_order="asc", projection={"title": 1}
+    ))
+
+    assert articles == [{"_id": "article1", "title": "AI"}]
+    pipeline = connected_client.collection.aggregate.call_args.args[0]
+    assert pipeline[0] == {"$match": {"category": "technology"}}
+    assert pipeline[1] == {"$sort": {"published_at": 1}}
+    assert pipeline[2] == {"$limit": 5}
+    assert pipeline[3] == {"$project": {"title": 1}}
+    assert "$addFields" in pipeline[4]
+    assert connected_client.collection.aggregate.call_args.kwargs == {"batchSize": 5}
+
+
+def test_json_safe_published_at_only_converts_dates():
+    """Test that only BSON dates are stringified; other values pass through."""
+    condition, then, otherwise = mongodb_client._JSON_SAFE_FIELDS["published_at"]["$cond"]
+
+    assert condition == {"$eq": [{"$type": "$published_at"}, "date"]}
+    assert then == {
+        "$dateToString": {"format": "%Y-%m-%dT%H:%M:%S.%LZ", "date": "$published_at"}
+    }
+    # A plain field reference keeps strings as-is and leaves missing fields out
+    assert otherwise == "$published_at"
+
+
+@pytest.mark.asyncio
+async def test_fetch_news_hours_ago_cutoff(connected_client):
+    """Test that hours_ago filters on a millisecond UTC cutoff."""
+    cursor = mock_cursor([])
+    connected_client.collection.aggregate = AsyncMock(return_value=cursor)
+
+    with patch.object(mongodb_client.time, "time_ns", return_value=10 * 3_600_000 * 1_000_000):
+        await collect(connected_client.fetch_news(hours_ago=2))
+
+    match = connected_client.collection.aggregate.call_args.args[0][0]["$match"]
+    assert match["published_at"] == {"$gte": DatetimeMS(8 * 3_600_000)}
+
+
+@pytest.mark.asyncio
+async def test_fetch_news_filter_includes_only_set_arguments(connected_client):
+    """Test that the filter holds exactly the clauses for set arguments."""
+    cursor = mock_cursor([])
+    connected_client.collection.aggregate = AsyncMock(return_value=cursor)
+
+    await collect(connected_client.fetch_news(tags=["ai"], search_query="quantum"))
+
+    match = connected_client.collection.aggregate.call_args.args[0][0]["$match"]
+    assert match == {"tags": {"$in": ["ai"]}, "$text": {"$search": "quantum"}}
+    # $text queries can't be hinted onto a regular index
+    assert "hint" not in connected_client.collection.aggregate.call_args.kwargs
+
+
+@pytest.mark.asyncio
+async def test_get_summary_unpacks_facets(connected_client):
+    """Test that get_summary unpacks the $facet result."""
+    connected_client.collection.aggregate = AsyncMock(return_value=mock_cursor([{
+        "count": [{"n": 2}],
+        "categories": [{"_id": "technology"}, {"_id": "science"}],
+        "tags": [{"_id": "ai"}],
+    }]))
+
+    summary = await connected_client.get_summary()
+
+    assert summary == {"count": 2, "categories": ["technology", "science"], "tags": ["ai"]}
+    facets = connected_client.collection.aggregate.call_args.args[0][0]["$facet"]
+    assert facets["categories"][0] == {"$match": {"category": {"$exists": True, "$ne": None}}}
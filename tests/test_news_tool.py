@@ -1,18 +1,40 @@
 """Tests for the fetch news tool."""
 
+import asyncio
+import importlib.util
+import json
+import sys
+
 import pytest
+from bson import ObjectId
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
-from src.tools.fetch_news import FetchNewsTool
+from src.tools import fetch_news as fetch_news_module
+from src.tools.fetch_news import (
+    CONTENT_PROJECTION,
+    SUMMARY_PROJECTION,
+    WIDGET_RESOURCE_URI,
+    FetchNewsArgs,
+    FetchNewsTool,
+)
 from src.mongodb_client import MongoDBClient
+from src.tools._render import render_article
+
+
+def stream(articles):
+    """Build a fetch_news side effect that streams the given articles."""
+    async def fetch_news(**kwargs):
+        for article in articles:
+            yield article
+    return fetch_news
 
 
 @pytest.fixture
 def mock_mongodb_client():
     """Create a mock MongoDB client."""
     client = MagicMock(spec=MongoDBClient)
-    client.fetch_news = AsyncMock()
+    client.fetch_news = MagicMock(side_effect=stream([]))
     return client
 
 
@@ -58,14 +80,18 @@ def sample_articles():
 @pytest.mark.asyncio
 async def test_execute_default_parameters(fetch_news_tool, mock_mongodb_client, sample_articles):
     """Test execute with default parameters."""
-    mock_mongodb_client.fetch_news.return_value = sample_articles
+    mock_mongodb_client.fetch_news.side_effect = stream(sample_articles)
     
     result = await fetch_news_tool.execute({})
     
     assert len(result) == 1
-    assert result[0].type == "text"
-    assert "AI Breakthrough" in result[0].text
-    assert "Climate Change" in result[0].text
+    assert result[0].type == "resource"
+    assert str(result[0].resource.uri) == WIDGET_RESOURCE_URI
+    assert result[0].resource.model_dump(by_alias=True)["mimeType"] == "application/json"
+    widget_data = json.loads(result[0].resource.text)
+    assert [a["title"] for a in widget_data["articles"]] == [
+        "AI Breakthrough in 2025", "Climate Change Update"
+    ]
     
     mock_mongodb_client.fetch_news.assert_called_once_with(
         limit=10,
@@ -74,14 +100,15 @@ async def test_execute_default_parameters(fetch_news_tool, mock_mongodb_client,
         search_query=None,
         hours_ago=None,
         sort_by="published_at",
-        sort_order="desc"
+        sort_order="desc",
+        projection=SUMMARY_PROJECTION
     )
 
 
 @pytest.mark.asyncio
 async def test_execute_with_filters(fetch_news_tool, mock_mongodb_client, sample_articles):
     """Test execute with filter parameters."""
-    mock_mongodb_client.fetch_news.return_value = [sample_articles[0]]
+    mock_mongodb_client.fetch_news.side_effect = stream([sample_articles[0]])
     
     arguments = {
         "limit": 5,
@@ -93,23 +120,127 @@ async def test_execute_with_filters(fetch_news_tool, mock_mongodb_client, sample
     result = await fetch_news_tool.execute(arguments)
     
     assert len(result) == 1
-    assert "AI Breakthrough" in result[0].text
+    assert "AI Breakthrough" in result[0].resource.text
     
     mock_mongodb_client.fetch_news.assert_called_once_with(
         limit=5,
         category="technology",
-        tags=["ai"],
+        tags=("ai",),
         search_query=None,
         hours_ago=24,
         sort_by="published_at",
-        sort_order="desc"
+        sort_order="desc",
+        projection=SUMMARY_PROJECTION
     )
 
 
+@pytest.mark.asyncio
+async def test_execute_with_normalized_args(fetch_news_tool, mock_mongodb_client, sample_articles):
+    """Test execute accepts pre-normalized FetchNewsArgs."""
+    mock_mongodb_client.fetch_news.side_effect = stream(sample_articles)
+    
+    arguments = FetchNewsArgs.from_arguments({"category": "science", "sort_order": "asc"})
+    result = await fetch_news_tool.execute(arguments)
+    
+    assert "Climate Change" in result[0].resource.text
+    mock_mongodb_client.fetch_news.assert_called_once_with(
+        limit=10,
+        category="science",
+        tags=None,
+        search_query=None,
+        hours_ago=None,
+        sort_by="published_at",
+        sort_order="asc",
+        projection=SUMMARY_PROJECTION
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_include_content(fetch_news_tool, mock_mongodb_client, sample_articles):
+    """Test execute fetches truncated content when it is requested."""
+    mock_mongodb_client.fetch_news.side_effect = stream(sample_articles)
+    
+    await fetch_news_tool.execute({"include_content": True})
+    
+    assert mock_mongodb_client.fetch_news.call_args.kwargs["projection"] == CONTENT_PROJECTION
+
+
+@pytest.mark.asyncio
+async def test_execute_caches_rendered_response(
+    fetch_news_tool, mock_mongodb_client, sample_articles
+):
+    """Test repeated identical calls reuse the rendered response."""
+    mock_mongodb_client.fetch_news.side_effect = stream(sample_articles)
+    
+    first = await fetch_news_tool.execute({"category": "technology"})
+    second = await fetch_news_tool.execute({"category": "technology"})
+    await fetch_news_tool.execute({"category": "science"})
+    
+    assert second is first
+    assert mock_mongodb_client.fetch_news.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_execute_equivalent_searches_share_cache(
+    fetch_news_tool, mock_mongodb_client, sample_articles
+):
+    """Test searches differing only in case/whitespace share a cache entry."""
+    mock_mongodb_client.fetch_news.side_effect = stream(sample_articles)
+    
+    await fetch_news_tool.execute({"search_query": "Quantum  Computing"})
+    await fetch_news_tool.execute({"search_query": " quantum computing "})
+    
+    mock_mongodb_client.fetch_news.assert_called_once()
+    assert mock_mongodb_client.fetch_news.call_args.kwargs["search_query"] == "quantum computing"
+
+
+@pytest.mark.asyncio
+async def test_execute_reordered_tags_share_cache(
+    fetch_news_tool, mock_mongodb_client, sample_articles
+):
+    """Test tag lists differing only in order share a cache entry."""
+    mock_mongodb_client.fetch_news.side_effect = stream(sample_articles)
+    
+    await fetch_news_tool.execute({"tags": ["b", "a"]})
+    await fetch_news_tool.execute({"tags": ["a", "b"]})
+    
+    mock_mongodb_client.fetch_news.assert_called_once()
+    assert mock_mongodb_client.fetch_news.call_args.kwargs["tags"] == ("a", "b")
+
+
+@pytest.mark.asyncio
+async def test_execute_batches_concurrent_identical_calls(mock_mongodb_client, sample_articles):
+    """Test concurrent identical calls share one query when batching is on."""
+    mock_mongodb_client.fetch_news.side_effect = stream(sample_articles)
+    tool = FetchNewsTool(mock_mongodb_client, batch_requests=True)
+    
+    results = await asyncio.gather(
+        tool.execute({"category": "technology"}),
+        tool.execute({"category": "technology"}),
+        tool.execute({"category": "science"}),
+    )
+    
+    assert results[0] is results[1]
+    assert results[2] is not results[0]
+    assert mock_mongodb_client.fetch_news.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_execute_batched_error_reaches_every_caller(mock_mongodb_client):
+    """Test a failed batched query reports the error to each caller."""
+    mock_mongodb_client.fetch_news.side_effect = Exception("Database connection failed")
+    tool = FetchNewsTool(mock_mongodb_client, batch_requests=True)
+    
+    results = await asyncio.gather(tool.execute({}), tool.execute({}))
+    
+    assert all("Database connection failed" in result[0].text for result in results)
+    mock_mongodb_client.fetch_news.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_execute_no_results(fetch_news_tool, mock_mongodb_client):
     """Test execute when no articles are found."""
-    mock_mongodb_client.fetch_news.return_value = []
+    mock_mongodb_client.fetch_news.side_effect = stream([])
     
     result = await fetch_news_tool.execute({})
     
@@ -129,11 +260,14 @@ async def test_execute_error_handling(fetch_news_tool, mock_mongodb_client):
     assert "Database connection failed" in result[0].text
 
 
-def test_format_articles_for_widget(fetch_news_tool, sample_articles):
-    """Test article formatting for widget display."""
-    result = fetch_news_tool._format_articles_for_widget(sample_articles)
+@pytest.mark.asyncio
+async def test_execute_format_both(fetch_news_tool, mock_mongodb_client, sample_articles):
+    """Test the both format returns readable text and the widget resource."""
+    mock_mongodb_client.fetch_news.side_effect = stream(sample_articles)
     
-    assert len(result) == 1
+    result = await fetch_news_tool.execute({"format": "both"})
+    
+    assert [item.type for item in result] == ["text", "resource"]
     text = result[0].text
     
     # Check human-readable format
@@ -141,15 +275,71 @@ def test_format_articles_for_widget(fetch_news_tool, sample_articles):
     assert "AI Breakthrough" in text
     assert "Climate Change" in text
     
-    # Check JSON widget data is included
-    assert "```json" in text
-    assert '"type": "news_feed"' in text
-    assert '"count": 2' in text
+    # Check JSON widget data is embedded separately, without indentation
+    widget_json = result[1].resource.text
+    assert "\n" not in widget_json
+    assert json.loads(widget_json)["type"] == "news_feed"
+    assert json.loads(widget_json)["count"] == 2
 
 
-def test_create_readable_output(fetch_news_tool, sample_articles):
+@pytest.mark.asyncio
+async def test_execute_format_widget(fetch_news_tool, mock_mongodb_client, sample_articles):
+    """Test the default widget format skips the readable text."""
+    mock_mongodb_client.fetch_news.side_effect = stream(sample_articles)
+    
+    result = await fetch_news_tool.execute({"format": "widget"})
+    
+    assert [item.type for item in result] == ["resource"]
+    assert json.loads(result[0].resource.text)["count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_execute_format_text(fetch_news_tool, mock_mongodb_client, sample_articles):
+    """Test the text format skips the widget JSON."""
+    mock_mongodb_client.fetch_news.side_effect = stream(sample_articles)
+    
+    result = await fetch_news_tool.execute({"format": "text"})
+    
+    assert [item.type for item in result] == ["text"]
+    assert result[0].text.startswith("Found 2 news article(s)")
+
+
+@pytest.mark.asyncio
+async def test_execute_widget_raw_bson_types(fetch_news_tool, mock_mongodb_client, sample_articles):
+    """Test widget JSON serializes raw ObjectId and datetime values."""
+    article = dict(sample_articles[0], _id=ObjectId("652b9c1e8f1b2c3d4e5f6a7b"))
+    article["published_at"] = datetime(2025, 10, 15, 10, 0)
+    mock_mongodb_client.fetch_news.side_effect = stream([article])
+    
+    text = (await fetch_news_tool.execute({}))[0].resource.text
+    
+    widget_article = json.loads(text)["articles"][0]
+    assert widget_article["id"] == "652b9c1e8f1b2c3d4e5f6a7b"
+    assert widget_article["published_at"] == "2025-10-15T10:00:00"
+
+
+@pytest.mark.parametrize("missing", [("orjson",), ("orjson", "ujson")])
+def test_json_fallback_matches_orjson(missing, sample_articles):
+    """Test the ujson and stdlib fallbacks emit the same widget JSON."""
+    pytest.importorskip("ujson")
+    spec = importlib.util.spec_from_file_location("fetch_news_fallback", fetch_news_module.__file__)
+    fallback = importlib.util.module_from_spec(spec)
+    with patch.dict(sys.modules, dict.fromkeys(missing)):
+        spec.loader.exec_module(fallback)
+    
+    article = dict(sample_articles[0], _id=ObjectId("652b9c1e8f1b2c3d4e5f6a7b"))
+    article["published_at"] = datetime(2025, 10, 15, 10, 0)
+    data = {"count": 2, "articles": [article, sample_articles[1]], "note": "café"}
+    
+    assert fallback._dumps(data) == fetch_news_module._dumps(data)
+
+
+@pytest.mark.asyncio
+async def test_execute_readable_output(fetch_news_tool, mock_mongodb_client, sample_articles):
     """Test creation of human-readable output."""
-    output = fetch_news_tool._create_readable_output(sample_articles)
+    mock_mongodb_client.fetch_news.side_effect = stream(sample_articles)
+    
+    output = (await fetch_news_tool.execute({"format": "text"}))[0].text
     
     assert "Found 2 news article(s)" in output
     assert "**1. AI Breakthrough in 2025**" in output
@@ -158,4 +348,41 @@ def test_create_readable_output(fetch_news_tool, sample_articles):
     assert "📰 Source: Science Daily" in output
     assert "✍️  Author: John Doe" in output
     assert "🏷️  Category: technology" in output
-    assert "🔖 Tags: ai, machine-learning" in output
\ No newline at end of file
+    assert "🔖 Tags: ai, machine-learning" in output
+
+
+@pytest.mark.asyncio
+async def test_execute_both_formats_describe_same_articles(
+    fetch_news_tool, mock_mongodb_client, sample_articles
+):
+    """Test the single rendering pass yields matching text and widget articles."""
+    mock_mongodb_client.fetch_news.side_effect = stream(sample_articles)
+    
+    text, resource = await fetch_news_tool.execute({"format": "both"})
+    widget_articles = json.loads(resource.resource.text)["articles"]
+    
+    assert [a["id"] for a in widget_articles] == ["article1", "article2"]
+    assert widget_articles[0]["source"] == "Tech News"
+    assert widget_articles[1]["tags"] == ["climate", "environment"]
+    assert all(f"**{i}. {a['title']}**" in text.text for i, a in enumerate(widget_articles, 1))
+
+
+def test_render_article_looks_up_each_field_once(sample_articles):
+    """Test rendering reads each article field at most once per output."""
+    class CountingDict(dict):
+        def __init__(self, *args):
+            super().__init__(*args)
+            self.keys_read = []
+
+        def get(self, key, default=None):
+            self.keys_read.append(key)
+            return super().get(key, default)
+
+    widget_only = CountingDict(sample_articles[0])
+    render_article(1, widget_only, None)
+    assert len(widget_only.keys_read) == len(set(widget_only.keys_read))
+
+    # Readable output re-reads only the fields whose defaults differ
+    both = CountingDict(sample_articles[0])
+    render_article(1, both, [])
+    assert sorted(both.keys_read[len(widget_only.keys_read):]) == ["author", "category", "source"]